@@ -0,0 +1,107 @@
+# https://pylint.pycqa.org/en/latest/technical_reference/features.html
+# pylint: disable=E1101
+# pylint: disable=C0114
+
+import os
+import random
+import sys
+import time
+import pygame
+from game import Renderer, Settings
+
+BUBBLE_COUNT = 50
+FRAMES = 300
+
+def load_scene(convert) -> list[tuple[pygame.Surface, tuple[int, int], int]]:
+    """
+    Load background, bubbles and cursor like the game does,
+    with or without conversion to the display format
+    """
+
+    rng = random.Random(0)
+
+    background = pygame.transform.scale(
+        pygame.image.load(Settings.create_image_path('background.jpg')), Settings.get_size())
+    bubble = pygame.image.load(Settings.create_image_path('bubble1.png'))
+    cursor = pygame.transform.scale(
+        pygame.image.load(Settings.create_image_path('cursor1.png')), (30, 30))
+
+    if convert:
+        background = Renderer.convert(background)
+        bubble = Renderer.convert(bubble, True)
+        cursor = Renderer.convert(cursor, True)
+
+    scene = [(background, (0, 0), Renderer.LAYER_BACKGROUND)]
+    for _ in range(BUBBLE_COUNT):
+        size = rng.randint(10, 80)
+        position = (rng.randint(0, Settings.window_width - size),
+                    rng.randint(0, Settings.window_height - size))
+        scene.append((pygame.transform.scale(bubble, (size, size)), position,
+                      Renderer.LAYER_BUBBLES))
+    scene.append((cursor, (0, 0), Renderer.LAYER_CURSOR))
+
+    return scene
+
+def run_blit(screen, scene) -> float:
+    """
+    Draw the scene with one blit() per surface, return blits per second
+    """
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for surface, position, _ in scene:
+            screen.blit(surface, position)
+    return FRAMES * len(scene) / (time.perf_counter() - start)
+
+def run_blits(screen, scene) -> float:
+    """
+    Draw the scene with a single blits() call per frame, return blits per second
+    """
+
+    blit_sequence = [(surface, position) for surface, position, _ in scene]
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.blits(blit_sequence, doreturn=False)
+    return FRAMES * len(scene) / (time.perf_counter() - start)
+
+def run_renderer(screen, scene) -> float:
+    """
+    Draw the scene through the renderer's blits() batch, return blits per second
+    """
+
+    renderer = Renderer(screen)
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for surface, position, layer in scene:
+            renderer.queue(surface, position, layer)
+        renderer.flush()
+    return FRAMES * len(scene) / (time.perf_counter() - start)
+
+def main() -> None:
+    """
+    Compare the blit throughput of the old and the new draw path
+    """
+
+    if '--headless' in sys.argv:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+    pygame.init()
+    screen = pygame.display.set_mode(Settings.get_size())
+
+    results = [
+        ('blit, unconverted', run_blit(screen, load_scene(False))),
+        ('blit, converted', run_blit(screen, load_scene(True))),
+        ('blits, converted', run_blits(screen, load_scene(True))),
+        ('renderer, converted', run_renderer(screen, load_scene(True)))
+    ]
+
+    baseline = results[0][1]
+    for name, throughput in results:
+        print(f'{name:<20} {throughput:>10.0f} blits/s  {throughput / baseline:.2f}x')
+
+    pygame.quit()
+
+if __name__ == '__main__':
+    main()
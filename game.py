@@ -7,10 +7,17 @@
 # pylint: disable=W0511
 # pylint: disable=E1136
 # pylint: disable=R0903
+# pylint: disable=R0904
+# pylint: disable=C0302
 
 import os
 import random
+import threading
+import weakref
+from collections import OrderedDict
+from itertools import chain
 from math import sqrt
+from typing import Optional
 import pygame
 
 class Settings:
@@ -56,6 +63,35 @@ class Settings:
     bubble_animation_speed = 1
     bubbles_max_initial = 5
 
+    # Wave settings
+    wave_seed = None # new random seed every game if None
+    wave_length = 10 # bubbles per level
+    wave_delay_step = 50 # in ms, spawn delay decrease per level
+    wave_delay_min = 300 # in ms
+    wave_limit_step = 1 # additional bubbles on screen per level
+    wave_speed_interval = 3 # increase max expansion rate every n levels
+    wave_position_candidates = 4 # alternative positions per spawn
+
+    # Frame pacing settings
+    pacer_smoothing = 0.1 # weight of the newest frame in the moving average
+    pacer_overrun_factor = 1.1 # degrade when frames take longer than budget * factor
+    pacer_headroom_factor = 0.75 # restore when frames take less than budget * factor
+    pacer_frames_to_degrade = 30
+    pacer_frames_to_restore = 120
+    pacer_hover_interval = 4 # recompute hover every n frames when throttled
+    pacer_animation_step = 2 # animation frames advanced at once when skipping
+    pacer_collision_interval = 2 # check collisions every n frames when throttled
+    pacer_history_length = 50
+
+    # Memory settings
+    memory_budgets = { # in bytes per surface category
+        'frames': 4 * 1024 ** 2, # shared bubble animation, loaded once and never evicted
+        'bubbles': 4 * 1024 ** 2,
+        'text': 1024 ** 2,
+        'overlays': 3 * 1024 ** 2,
+        'background': 3 * 1024 ** 2
+    }
+
     # Sound settings
     volume = 0.1
 
@@ -66,6 +102,7 @@ class Settings:
     font_highscore = ('arialblack', 48)
     font_restart = ('arialblack', 32)
     font_points = ('arialblack', 28)
+    font_debug = ('arialblack', 14)
 
     # Strings
     title_points = "Points: %s"
@@ -88,18 +125,434 @@ class Timer:
             return True
         return False
 
+class SurfaceCache:
+    def __init__(self, accountant, category) -> None:
+        self.accountant = accountant
+        self.category = category
+        self.surfaces = OrderedDict()
+        self.largest = 0 # size of the largest surface created, kept free before creating
+
+        accountant.register_cache(self)
+
+    def get(self, key, factory) -> pygame.Surface:
+        """
+        Return the cached surface for key, creating it with factory if missing
+        """
+
+        if key in self.surfaces:
+            self.surfaces.move_to_end(key)
+            return self.surfaces[key]
+
+        self.accountant.enforce(self.category, self.largest)
+
+        surface = factory()
+        self.surfaces[key] = surface
+        self.accountant.track(surface, self.category)
+        self.largest = max(self.largest, SurfaceAccountant.get_surface_size(surface))
+
+        return surface
+
+    def evict_oldest(self) -> bool:
+        """
+        Drop the least recently used surface that is not referenced anywhere else,
+        return False if no surface could be freed
+        """
+
+        evicted = False
+        skipped = []
+        for key in list(self.surfaces):
+            surface = weakref.ref(self.surfaces.pop(key))
+            if surface() is None:
+                evicted = True
+                break
+
+            # Still in use, evicting it would not free any memory
+            skipped.append((key, surface()))
+
+        # Put skipped surfaces back in front, keeping their LRU order
+        for key, surface in reversed(skipped):
+            self.surfaces[key] = surface
+            self.surfaces.move_to_end(key, last=False)
+
+        return evicted
+
+class SurfaceAccountant:
+    def __init__(self, budgets) -> None:
+        self.budgets = dict(budgets)
+        self.usage = dict.fromkeys(budgets, 0)
+        self.peak = dict.fromkeys(budgets, 0)
+        self.peak_total = 0
+        self.caches = {category: [] for category in budgets}
+        self.evictions = 0
+        self.overruns = 0
+
+    @staticmethod
+    def get_surface_size(surface) -> int:
+        """
+        Return the pixel memory of a surface in bytes
+        """
+
+        return surface.get_pitch() * surface.get_height()
+
+    def register_cache(self, cache) -> None:
+        """
+        Allow the accountant to evict from cache when its category is over budget
+        """
+
+        self.caches[cache.category].append(cache)
+
+    def track(self, surface, category) -> pygame.Surface:
+        """
+        Account surface to category until it is garbage collected
+        """
+
+        size = SurfaceAccountant.get_surface_size(surface)
+        self.usage[category] += size
+        weakref.finalize(surface, self._release, category, size)
+
+        self.peak[category] = max(self.peak[category], self.usage[category])
+        self.peak_total = max(self.peak_total, sum(self.usage.values()))
+
+        self.enforce(category)
+        return surface
+
+    def _release(self, category, size) -> None:
+        """
+        Remove a collected surface from the usage
+        """
+
+        self.usage[category] -= size
+
+    def enforce(self, category, reserve=0) -> None:
+        """
+        Evict cached surfaces of category until it fits into its budget with
+        reserve bytes to spare, usage over budget that cannot be freed
+        after tracking a surface is counted as overrun
+        """
+
+        while self.usage[category] + reserve > self.budgets[category]:
+            if not any(cache.evict_oldest() for cache in self.caches[category]):
+                if not reserve:
+                    self.overruns += 1
+                return
+            self.evictions += 1
+
+    def is_within_budget(self) -> bool:
+        """
+        Check if no category ever exceeded its budget
+        """
+
+        return all(self.peak[category] <= self.budgets[category]
+                   for category in self.budgets)
+
+    def get_report(self) -> dict:
+        """
+        Return current and peak usage per category in bytes
+        """
+
+        return {
+            'usage': dict(self.usage),
+            'peak': dict(self.peak),
+            'budgets': dict(self.budgets),
+            'peak_total': self.peak_total,
+            'evictions': self.evictions,
+            'overruns': self.overruns,
+            'within_budget': self.is_within_budget()
+        }
+
+class FramePacer:
+    # Optional work is dropped in this order when frames overrun the budget,
+    # every level also keeps the savings of the levels below
+    LEVEL_FULL = 0
+    LEVEL_THROTTLE_HOVER = 1
+    LEVEL_SKIP_ANIMATION = 2
+    LEVEL_THROTTLE_COLLISION = 3
+
+    def __init__(self, fps) -> None:
+        self.budget = 1000 / fps
+        self.frame_time = 0.0
+        self.level = FramePacer.LEVEL_FULL
+        self.frame_count = 0
+        self.overrun_frames = 0
+        self.headroom_frames = 0
+        self.history = []
+
+    def tick(self, frame_time) -> None:
+        """
+        Feed the work time of the last frame (in ms) and adjust the quality level
+        """
+
+        self.frame_count += 1
+        self.frame_time += (frame_time - self.frame_time) * Settings.pacer_smoothing
+
+        if self.frame_time > self.budget * Settings.pacer_overrun_factor:
+            self.overrun_frames += 1
+            self.headroom_frames = 0
+        elif self.frame_time < self.budget * Settings.pacer_headroom_factor:
+            self.headroom_frames += 1
+            self.overrun_frames = 0
+        else:
+            self.overrun_frames = 0
+            self.headroom_frames = 0
+
+        if self.overrun_frames >= Settings.pacer_frames_to_degrade \
+                and self.level < FramePacer.LEVEL_THROTTLE_COLLISION:
+            self.set_level(self.level + 1)
+        elif self.headroom_frames >= Settings.pacer_frames_to_restore \
+                and self.level > FramePacer.LEVEL_FULL:
+            self.set_level(self.level - 1)
+
+    def set_level(self, level) -> None:
+        """
+        Switch to another quality level and record the decision
+        """
+
+        self.history.append((self.frame_count, self.level, level, round(self.frame_time, 2)))
+        del self.history[:-Settings.pacer_history_length]
+
+        self.level = level
+        self.overrun_frames = 0
+        self.headroom_frames = 0
+
+    def should_update_hover(self) -> bool:
+        """
+        Check if the hover state should be recomputed this frame
+        """
+
+        if self.level < FramePacer.LEVEL_THROTTLE_HOVER:
+            return True
+        return self.frame_count % Settings.pacer_hover_interval == 0
+
+    def should_check_collision(self) -> bool:
+        """
+        Check if bubble collisions should be checked this frame
+        """
+
+        if self.level < FramePacer.LEVEL_THROTTLE_COLLISION:
+            return True
+        return self.frame_count % Settings.pacer_collision_interval == 0
+
+    def get_animation_step(self) -> int:
+        """
+        Number of animation frames to advance at once
+        """
+
+        if self.level < FramePacer.LEVEL_SKIP_ANIMATION:
+            return 1
+        return Settings.pacer_animation_step
+
+    def get_debug_info(self) -> dict:
+        """
+        Return the current measurements and the recent level changes
+        (frame, old level, new level, average frame time)
+        """
+
+        return {
+            'budget': round(self.budget, 2),
+            'frame_time': round(self.frame_time, 2),
+            'level': self.level,
+            'frame_count': self.frame_count,
+            'overrun_frames': self.overrun_frames,
+            'headroom_frames': self.headroom_frames,
+            'history': list(self.history)
+        }
+
+class WaveEngine:
+    def __init__(self, seed=None) -> None:
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.schedules = {}
+        self.threads = {}
+        self.lock = threading.Lock()
+
+        self.level = 0
+        self.schedule = []
+        self.time_since_spawn = 0
+        self.blocked_spawns = 0
+        self.start_level(0)
+
+    @staticmethod
+    def get_level_parameters(level) -> tuple[int, int, tuple[int, int]]:
+        """
+        Return spawn delay, bubble limit and expansion rate range of a level
+        """
+
+        delay = max(Settings.bubble_delay - level * Settings.wave_delay_step,
+                    Settings.wave_delay_min)
+        limit = Settings.bubbles_max_initial + level * Settings.wave_limit_step
+        speed_min, speed_max = Settings.bubble_spawn_speed_initial
+        speed = (speed_min, speed_max + level // Settings.wave_speed_interval)
+
+        return delay, limit, speed
+
+    @staticmethod
+    def build_schedule(seed, level) -> list[tuple[int, list[tuple[int, int]], int]]:
+        """
+        Precompute the spawns of a level as (delay, candidate positions, expansion rate),
+        the same seed and level always result in the same schedule
+        """
+
+        rng = random.Random(f'{seed}-{level}')
+        delay, limit, speed = WaveEngine.get_level_parameters(level)
+        bubble_size = Settings.bubble_radius * 2
+
+        schedule = []
+        for _ in range(Settings.wave_length):
+            occupied = [(entry[1][0], bubble_size) for entry in schedule[-limit:]]
+
+            candidates = []
+            for _ in range(Settings.wave_position_candidates):
+                position = Bubble.generate_position(rng, occupied)
+                candidates.append(position)
+                occupied.append((position, bubble_size))
+
+            schedule.append((delay, candidates, rng.randint(*speed)))
+
+        return schedule
+
+    def _build_in_background(self, level) -> None:
+        """
+        Build a schedule and store it for later use
+        """
+
+        schedule = WaveEngine.build_schedule(self.seed, level)
+
+        with self.lock:
+            self.schedules[level] = schedule
+
+    def prefetch(self, level) -> None:
+        """
+        Start building the schedule of a level on a background thread
+        """
+
+        if level in self.threads or level in self.schedules:
+            return
+
+        thread = threading.Thread(
+            target=self._build_in_background, args=(level,), daemon=True)
+        self.threads[level] = thread
+        thread.start()
+
+    def get_schedule(self, level) -> list[tuple[int, list[tuple[int, int]], int]]:
+        """
+        Return the schedule of a level, waiting for it if it is still being built
+        """
+
+        thread = self.threads.pop(level, None)
+        if thread is not None:
+            thread.join()
+
+        with self.lock:
+            schedule = self.schedules.pop(level, None)
+
+        if schedule is None:
+            schedule = WaveEngine.build_schedule(self.seed, level)
+
+        return schedule
+
+    def start_level(self, level) -> None:
+        """
+        Switch to a level and prepare the following one
+        """
+
+        self.level = level
+        self.schedule = list(reversed(self.get_schedule(level)))
+        self.prefetch(level + 1)
+
+    @property
+    def bubbles_limit(self) -> int:
+        """
+        Maximum number of bubbles on screen in the current level
+        """
+
+        return WaveEngine.get_level_parameters(self.level)[1]
+
+    def pop_due(self, elapsed, bubble_count) -> Optional[tuple[list[tuple[int, int]], int]]:
+        """
+        Advance the wave by elapsed ms and return the (candidate positions,
+        expansion rate) of the next bubble if it has to be spawned now.
+        At most one bubble is spawned per call and the time waited while the
+        screen is full does not add up, so freed slots are refilled one per delay
+        """
+
+        if not self.schedule:
+            self.start_level(self.level + 1)
+
+        delay, candidates, expansion_rate = self.schedule[-1]
+        self.time_since_spawn = min(self.time_since_spawn + elapsed, delay)
+
+        if bubble_count > self.bubbles_limit or self.time_since_spawn < delay:
+            return None
+
+        self.schedule.pop()
+        self.time_since_spawn = 0
+
+        return candidates, expansion_rate
+
+    def get_debug_info(self) -> dict:
+        """
+        Return the state of the current wave
+        """
+
+        return {
+            'seed': self.seed,
+            'level': self.level,
+            'remaining': len(self.schedule),
+            'prefetched': sorted(self.schedules),
+            'blocked_spawns': self.blocked_spawns
+        }
+
+class Renderer:
+    # Draw order, lower layers are drawn first
+    LAYER_BACKGROUND = 0
+    LAYER_BUBBLES = 1
+    LAYER_HUD = 2
+    LAYER_OVERLAY = 3
+    LAYER_MENU = 4
+    LAYER_MENU_TEXT = 5
+    LAYER_CURSOR = 6
+
+    def __init__(self, screen) -> None:
+        self.screen = screen
+        self.layers = [[] for _ in range(Renderer.LAYER_CURSOR + 1)]
+
+    @staticmethod
+    def convert(surface, alpha=False) -> pygame.Surface:
+        """
+        Convert surface to the display format so blitting needs no conversion
+        """
+
+        if alpha:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def queue(self, surface, dest, layer) -> None:
+        """
+        Add a surface to the draw list of its layer for the current frame
+        """
+
+        self.layers[layer].append((surface, dest))
+
+    def flush(self) -> None:
+        """
+        Draw the queued surfaces layer by layer with a single blits() call
+        """
+
+        self.screen.blits(chain.from_iterable(self.layers), doreturn=False)
+        for layer in self.layers:
+            layer.clear()
+
 class Background(pygame.sprite.Sprite):
     def __init__(self, image_name='background.jpg') -> None:
         super().__init__()
 
         self.image = pygame.image.load(Settings.create_image_path(image_name))
-        self.image = pygame.transform.scale(self.image, Settings.get_size())
+        self.image = Renderer.convert(pygame.transform.scale(self.image, Settings.get_size()))
 
-    def draw(self, screen):
+    def draw(self, renderer):
         """
         Draw sprite on screen at position 0/0
         """
-        screen.blit(self.image, (0, 0))
+        renderer.queue(self.image, (0, 0), Renderer.LAYER_BACKGROUND)
 
     def update(self):
         """
@@ -111,12 +564,13 @@ class Cursor(pygame.sprite.Sprite):
         super().__init__()
 
         self.cursors = [
-            pygame.image.load(Settings.create_image_path('cursor1.png')),
-            pygame.image.load(Settings.create_image_path('cursor2.png'))
+            Renderer.convert(pygame.transform.scale(
+                pygame.image.load(Settings.create_image_path('cursor1.png')), (30, 30)), True),
+            Renderer.convert(pygame.transform.scale(
+                pygame.image.load(Settings.create_image_path('cursor2.png')), (30, 30)), True)
         ]
 
         self.image = self.cursors[0]
-        self.image = pygame.transform.scale(self.image, (30, 30))
         self.rect = self.image.get_rect()
 
     def select_cursor(self, cursor_number):
@@ -124,17 +578,14 @@ class Cursor(pygame.sprite.Sprite):
         Select cursor from index
         """
 
-        old_rect = self.rect
         self.image = self.cursors[cursor_number]
-        self.image = pygame.transform.scale(self.image, (30, 30))
-        self.rect = old_rect
 
-    def draw(self, screen):
+    def draw(self, renderer):
         """
         Draw sprite on screen at position 0/0
         """
 
-        screen.blit(self.image, self.rect)
+        renderer.queue(self.image, self.rect, Renderer.LAYER_CURSOR)
 
     def update(self, pos):
         """
@@ -144,29 +595,27 @@ class Cursor(pygame.sprite.Sprite):
         self.rect.topleft = pos
 
 class Bubble(pygame.sprite.Sprite):
-    def __init__(self) -> None:
+    def __init__(self, position, expansion_rate) -> None:
         super().__init__()
 
-        self.images = Bubble.get_bubble_images()
+        self.images = game.bubble_images # shared between all bubbles
         self.state = 0  # Current image
         self.killed = False
 
-        self.image = self.images[self.state]
-        self.image = pygame.transform.scale(
-            self.images[self.state], (Settings.bubble_radius * 2, Settings.bubble_radius * 2))
+        self.image = self.get_scaled_image(
+            (Settings.bubble_radius * 2, Settings.bubble_radius * 2))
         self.rect = self.image.get_rect()
         self.radius = self.rect.width // 2
 
-        self.expansion_rate = random.randint(*game.bubble_spawn_speed)
-
-        self.rect.center = Bubble.generate_next_free_position()
+        self.expansion_rate = expansion_rate
+        self.rect.center = position
 
         pygame.mixer.Sound.play(game.sound_spawn_bubble)
 
     @staticmethod
     def get_bubble_images() -> list[pygame.Surface]:
         """
-        Get all images used in the animation
+        Load all images used in the animation
         """
 
         bubble_images = sorted(['bubble1.png',
@@ -176,32 +625,50 @@ class Bubble(pygame.sprite.Sprite):
                                 'bubble5.png',
                                 'bubble6.png',
                                 'bubble7.png'])
-        return [pygame.image.load(Settings.create_image_path(img))
+        return [Renderer.convert(pygame.image.load(Settings.create_image_path(img)), True)
                 for img in bubble_images]
 
+    def get_scaled_image(self, size) -> pygame.Surface:
+        """
+        Get the current animation image scaled to size,
+        shared between all bubbles of the same size
+        """
+
+        return game.bubble_cache.get(
+            (self.state, size),
+            lambda: pygame.transform.scale(self.images[self.state], size))
+
     @staticmethod
-    def generate_next_free_position(depth=0) -> tuple[int, int]:
+    def generate_position(rng, occupied) -> tuple[int, int]:
         """
-        Generate random position on the screen and check if valid
+        Generate random position on the screen which is far enough away
+        from the occupied (center, width) spots, giving up after 50 retries
         """
 
-        random_pos = (
-            random.randint(
-                10 + Settings.bubble_radius,
-                Settings.window_width -
-                Settings.bubble_radius -
-                10),
-            random.randint(
-                10 + Settings.bubble_radius,
-                Settings.window_height -
-                Settings.bubble_radius -
-                10))
+        margin = Settings.bubble_spawn_margin + Settings.bubble_radius
+
+        for _ in range(51):
+            random_pos = (
+                rng.randint(margin, Settings.window_width - margin),
+                rng.randint(margin, Settings.window_height - margin))
 
-        if not Bubble._check_if_pos_is_valid(random_pos) and depth <= 50:
-            return Bubble.generate_next_free_position(depth=depth + 1)
+            if Bubble._is_far_enough(random_pos, occupied):
+                break
 
         return random_pos
 
+    @staticmethod
+    def choose_free_position(candidates) -> Optional[tuple[int, int]]:
+        """
+        Return the first candidate position which is not blocked by a bubble
+        """
+
+        for position in candidates:
+            if Bubble._check_if_pos_is_valid(position):
+                return position
+
+        return None
+
     @staticmethod
     def _check_if_pos_is_valid(position):
         """
@@ -211,6 +678,14 @@ class Bubble(pygame.sprite.Sprite):
         bubbles = [(bubble.rect.center, bubble.rect.width)
                    for bubble in game.bubbles.sprites()]
 
+        return Bubble._is_far_enough(position, bubbles)
+
+    @staticmethod
+    def _is_far_enough(position, bubbles):
+        """
+        Check if position is far enough away from every (center, width) spot
+        """
+
         for bubble in bubbles:
             bubble_pos = bubble[0]
             dist_x = abs(bubble_pos[0] - position[0])
@@ -239,12 +714,12 @@ class Bubble(pygame.sprite.Sprite):
 
         game.bubble_animation_frames = 0
 
-        self.state += 1
+        self.state = min(self.state + game.pacer.get_animation_step(),
+                         len(self.images) - 1)
         old_center = self.rect.center
         old_size = self.rect.size
 
-        self.image = self.images[self.state]
-        self.image = pygame.transform.scale(self.image, old_size)
+        self.image = self.get_scaled_image(old_size)
         self.rect = self.image.get_rect()
         self.rect.center = old_center
 
@@ -257,8 +732,8 @@ class Bubble(pygame.sprite.Sprite):
         """
 
         center = self.rect.center
-        self.image = pygame.transform.scale(self.images[self.state], (
-            self.rect.width + self.expansion_rate, self.rect.height + self.expansion_rate))
+        self.image = self.get_scaled_image(
+            (self.rect.width + self.expansion_rate, self.rect.height + self.expansion_rate))
         self.rect = self.image.get_rect()
         self.rect.center = center
         self.radius = self.rect.width // 2
@@ -270,12 +745,12 @@ class Bubble(pygame.sprite.Sprite):
 
         return self.rect.collidepoint(mouse_pos)
 
-    def draw(self, screen):
+    def draw(self, renderer):
         """
         Draw sprite on screen
         """
 
-        screen.blit(self.image, self.rect)
+        renderer.queue(self.image, self.rect, Renderer.LAYER_BUBBLES)
 
     def check_bubble_collision(self):
         """
@@ -327,7 +802,8 @@ class Bubble(pygame.sprite.Sprite):
             self.kill()
             return
 
-        self.check_collision()
+        if game.pacer.should_check_collision():
+            self.check_collision()
 
 
 class Game:
@@ -338,22 +814,35 @@ class Game:
         pygame.mouse.set_cursor(*pygame.cursors.diamond)
 
         self.screen = pygame.display.set_mode(Settings.get_size())
+        self.renderer = Renderer(self.screen)
         self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(Settings.window_fps)
         self.running = True
+
+        self.surfaces = SurfaceAccountant(Settings.memory_budgets)
+        self.bubble_images = [self.surfaces.track(image, 'frames')
+                              for image in Bubble.get_bubble_images()]
+        self.bubble_cache = SurfaceCache(self.surfaces, 'bubbles')
+        self.text_cache = SurfaceCache(self.surfaces, 'text')
+        self.overlay_cache = SurfaceCache(self.surfaces, 'overlays')
+        self.fonts = {}
+
         self.cursor = Cursor()
+        for cursor in self.cursor.cursors:
+            self.surfaces.track(cursor, 'overlays')
 
-        self.bubble_delay_timer = Timer(Settings.bubble_delay)
         self.bubble_size_timer = Timer(Settings.bubble_delay)
 
         self.background = Background()
+        self.surfaces.track(self.background.image, 'background')
         self.bubbles = pygame.sprite.Group()
         self.bubble_animation_frames = 0
-        self.bubbles_limit = Settings.bubbles_max_initial
-        self.bubble_spawn_speed = Settings.bubble_spawn_speed_initial
+        self.waves = WaveEngine(Settings.wave_seed)
 
         self.game_over = False
         self.pause = False
         self.end = False
+        self.debug = False
         self.points = 0
 
         pygame.mouse.set_visible(False)
@@ -366,8 +855,9 @@ class Game:
             Settings.create_sound_path('collision.mp3'))
 
         # Game Over Button (Precreated to use collision in events)
-        self.restart_surface = pygame.Surface((200, 50))
+        self.restart_surface = Renderer.convert(pygame.Surface((200, 50)))
         self.restart_surface.fill((255, 255, 255))
+        self.surfaces.track(self.restart_surface, 'overlays')
         self.restart_surface_rect = self.restart_surface.get_rect()
         self.restart_surface_rect.center = (
             Settings.window_width // 2, Settings.window_height // 2 + 175)
@@ -379,6 +869,7 @@ class Game:
 
         while self.running:
             self.clock.tick(Settings.window_fps)
+            self.pacer.tick(self.clock.get_rawtime())
             self.handle_events()
 
             self.draw()
@@ -403,6 +894,8 @@ class Game:
             self.end = True
         elif event.key == pygame.K_p:
             self.pause = not self.pause
+        elif event.key == pygame.K_F3:
+            self.debug = not self.debug
 
     def handle_mouse_events(self, event) -> None:
         """
@@ -443,16 +936,18 @@ class Game:
         Respawning bubbles
         """
 
-        if len(self.bubbles.sprites()) <= self.bubbles_limit:
-            if self.bubble_delay_timer.is_next_stop_reached():
-                self.bubbles.add(Bubble())
+        spawn = self.waves.pop_due(self.clock.get_time(), len(self.bubbles.sprites()))
+        if spawn is None:
+            return
 
-    def decrease_delay(self) -> None:
-        """
-        Decreasing delay between bubbles spawning
-        """
+        candidates, expansion_rate = spawn
+        position = Bubble.choose_free_position(candidates)
+        if position is None:
+            # Every candidate is covered by a grown bubble, stay deterministic
+            self.waves.blocked_spawns += 1
+            position = candidates[0]
 
-        self.bubble_delay_timer.duration = Settings.bubble_delay - max(self.points // 250, 5)
+        self.bubbles.add(Bubble(position, expansion_rate))
 
     def update(self) -> None:
         """
@@ -460,7 +955,6 @@ class Game:
         """
 
         self.respawn_bubbles()
-        self.decrease_delay()
 
         self.bubbles.update()
 
@@ -468,6 +962,9 @@ class Game:
             for bubble in self.bubbles.sprites():
                 bubble.increase_size()
 
+        if not self.pacer.should_update_hover():
+            return
+
         any_bubble_hovered = False
         for bubble in self.bubbles.sprites():
             if bubble.is_hovered(pygame.mouse.get_pos()):
@@ -483,10 +980,13 @@ class Game:
 
         self.screen.fill((0, 0, 0))
 
-        self.background.draw(self.screen)
-        self.bubbles.draw(self.screen)
+        self.background.draw(self.renderer)
+        for bubble in self.bubbles.sprites():
+            bubble.draw(self.renderer)
 
         self.draw_points()
+        if self.debug:
+            self.draw_debug()
 
         if self.pause:
             self.draw_pause()
@@ -495,56 +995,76 @@ class Game:
         if self.end:
             self.draw_end()
 
-        self.cursor.draw(self.screen)
+        self.cursor.draw(self.renderer)
 
+        self.renderer.flush()
         pygame.display.flip()
 
-    def draw_pause(self) -> None:
+    def draw_overlay(self) -> None:
         """
-        Draw the pause screen
+        Darken the screen behind pause and game over texts
+        """
+
+        overlay = self.overlay_cache.get(
+            ('overlay', self.screen.get_size()), self.create_overlay)
+        self.renderer.queue(overlay, (0, 0), Renderer.LAYER_OVERLAY)
+
+    def create_overlay(self) -> pygame.Surface:
+        """
+        Create a transparent black surface covering the screen
         """
 
-        overlay = pygame.Surface(self.screen.get_size())
+        overlay = Renderer.convert(pygame.Surface(self.screen.get_size()))
         overlay.set_alpha(180)
         overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        return overlay
+
+    def render_text(self, font, text, antialias, color) -> pygame.Surface:
+        """
+        Render text with a (name, size) font, reusing earlier renderings
+        """
 
-        font = pygame.font.SysFont(
-            Settings.font_pause[0],
-            Settings.font_pause[1])
-        pause_text = font.render(
+        if font not in self.fonts:
+            self.fonts[font] = pygame.font.SysFont(*font)
+
+        return self.text_cache.get(
+            (font, text, antialias, color),
+            lambda: self.fonts[font].render(text, antialias, color))
+
+    def draw_pause(self) -> None:
+        """
+        Draw the pause screen
+        """
+
+        self.draw_overlay()
+
+        pause_text = self.render_text(
+            Settings.font_pause,
             'PAUSE', True, (255, 255, 255))
         pause_text_rect = pause_text.get_rect()
         pause_text_rect.center = (
             Settings.window_width // 2, Settings.window_height // 2)
 
-        self.screen.blit(pause_text, pause_text_rect)
+        self.renderer.queue(pause_text, pause_text_rect, Renderer.LAYER_MENU_TEXT)
 
     def draw_gameover(self) -> None:
         """
         Draw the game over screen
         """
 
-        overlay = pygame.Surface(self.screen.get_size())
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.draw_overlay()
 
-        font = pygame.font.SysFont(
-            Settings.font_gameover[0],
-            Settings.font_gameover[1])
-        gameover_text = font.render(
+        gameover_text = self.render_text(
+            Settings.font_gameover,
             'GAME OVER', True, (255, 255, 255))
         gameover_text_rect = gameover_text.get_rect()
         gameover_text_rect.center = (
             Settings.window_width // 2, Settings.window_height // 2 - 20)
 
-        self.screen.blit(gameover_text, gameover_text_rect)
+        self.renderer.queue(gameover_text, gameover_text_rect, Renderer.LAYER_MENU_TEXT)
 
-        font = pygame.font.SysFont(
-            Settings.font_score[0],
-            Settings.font_score[1])
-        points_text = font.render(
+        points_text = self.render_text(
+            Settings.font_score,
             Settings.title_points.replace(
                 '%s', str(
                     self.points)), True, (255, 255, 255))
@@ -552,12 +1072,10 @@ class Game:
         points_text_rect.center = (
             Settings.window_width // 2, Settings.window_height // 2 + 50)
 
-        self.screen.blit(points_text, points_text_rect)
+        self.renderer.queue(points_text, points_text_rect, Renderer.LAYER_MENU_TEXT)
 
-        font = pygame.font.SysFont(
-            Settings.font_highscore[0],
-            Settings.font_highscore[1])
-        highscore_text = font.render(
+        highscore_text = self.render_text(
+            Settings.font_highscore,
             Settings.title_highscore.replace(
                 '%s', str(
                     Game.get_highscore())), True, (255, 255, 255))
@@ -565,45 +1083,37 @@ class Game:
         highscore_text_rect.center = (
             Settings.window_width // 2, Settings.window_height // 2 + 100)
 
-        self.screen.blit(highscore_text, highscore_text_rect)
+        self.renderer.queue(highscore_text, highscore_text_rect, Renderer.LAYER_MENU_TEXT)
 
-        font = pygame.font.SysFont(
-            Settings.font_restart[0],
-            Settings.font_restart[1])
-        restart_text = font.render(
+        restart_text = self.render_text(
+            Settings.font_restart,
             "RESTART", True, (0, 0, 0))
         restart_text_rect = restart_text.get_rect()
         restart_text_rect.center = (
             Settings.window_width // 2, Settings.window_height // 2 + 175)
 
-        self.screen.blit(self.restart_surface, self.restart_surface_rect)
-        self.screen.blit(restart_text, restart_text_rect)
+        self.renderer.queue(self.restart_surface, self.restart_surface_rect,
+                            Renderer.LAYER_MENU)
+        self.renderer.queue(restart_text, restart_text_rect, Renderer.LAYER_MENU_TEXT)
 
     def draw_end(self) -> None:
         """
         Draw the game over screen
         """
 
-        overlay = pygame.Surface(self.screen.get_size())
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.draw_overlay()
 
-        font = pygame.font.SysFont(
-            Settings.font_gameover[0],
-            Settings.font_gameover[1])
-        end_text = font.render(
+        end_text = self.render_text(
+            Settings.font_gameover,
             'END', True, (255, 255, 255))
         end_text_rect = end_text.get_rect()
         end_text_rect.center = (
             Settings.window_width // 2, Settings.window_height // 2 - 20)
 
-        self.screen.blit(end_text, end_text_rect)
+        self.renderer.queue(end_text, end_text_rect, Renderer.LAYER_MENU_TEXT)
 
-        font = pygame.font.SysFont(
-            Settings.font_score[0],
-            Settings.font_score[1])
-        points_text = font.render(
+        points_text = self.render_text(
+            Settings.font_score,
             Settings.title_points.replace(
                 '%s', str(
                     self.points)), True, (255, 255, 255))
@@ -611,29 +1121,26 @@ class Game:
         points_text_rect.center = (
             Settings.window_width // 2, Settings.window_height // 2 + 50)
 
-        self.screen.blit(points_text, points_text_rect)
+        self.renderer.queue(points_text, points_text_rect, Renderer.LAYER_MENU_TEXT)
 
-        font = pygame.font.SysFont(
-            Settings.font_highscore[0],
-            Settings.font_highscore[1])
-        highscore_text = font.render("PRESS ESC TO QUIT", True, (255, 255, 255))
+        highscore_text = self.render_text(
+            Settings.font_highscore, "PRESS ESC TO QUIT", True, (255, 255, 255))
         highscore_text_rect = highscore_text.get_rect()
         highscore_text_rect.center = (
             Settings.window_width // 2, Settings.window_height // 2 + 100)
 
-        self.screen.blit(highscore_text, highscore_text_rect)
+        self.renderer.queue(highscore_text, highscore_text_rect, Renderer.LAYER_MENU_TEXT)
 
-        font = pygame.font.SysFont(
-            Settings.font_restart[0],
-            Settings.font_restart[1])
-        restart_text = font.render(
+        restart_text = self.render_text(
+            Settings.font_restart,
             "RESTART", True, (0, 0, 0))
         restart_text_rect = restart_text.get_rect()
         restart_text_rect.center = (
             Settings.window_width // 2, Settings.window_height // 2 + 175)
 
-        self.screen.blit(self.restart_surface, self.restart_surface_rect)
-        self.screen.blit(restart_text, restart_text_rect)
+        self.renderer.queue(self.restart_surface, self.restart_surface_rect,
+                            Renderer.LAYER_MENU)
+        self.renderer.queue(restart_text, restart_text_rect, Renderer.LAYER_MENU_TEXT)
 
 
     def click_restart_btn_handler(self, mouse_position) -> None:
@@ -652,10 +1159,23 @@ class Game:
         self.points = 0
         self.bubbles.empty()
         self.bubble_size_timer.duration = Settings.bubble_delay
-        self.bubble_delay_timer.duration = Settings.bubble_delay
+        self.waves = WaveEngine(Settings.wave_seed)
         self.game_over = False
         self.pause = False
 
+    def get_debug_info(self) -> dict:
+        """
+        Collect debug information about the running game
+        """
+
+        return {
+            'fps': round(self.clock.get_fps(), 2),
+            'bubbles': len(self.bubbles.sprites()),
+            'wave': self.waves.get_debug_info(),
+            'memory': self.surfaces.get_report(),
+            'pacer': self.pacer.get_debug_info()
+        }
+
     @staticmethod
     def get_highscore() -> int:
         """
@@ -707,10 +1227,8 @@ class Game:
         Draw a point counter onto the screen
         """
 
-        font = pygame.font.SysFont(
-            Settings.font_points[0],
-            Settings.font_points[1])
-        points_text = font.render(
+        points_text = self.render_text(
+            Settings.font_points,
             Settings.title_points.replace(
                 '%s', str(
                     self.points)), True, (255, 255, 255))
@@ -718,7 +1236,24 @@ class Game:
         points_text_rect.top = Settings.window_height - 50
         points_text_rect.left = 25
 
-        self.screen.blit(points_text, points_text_rect)
+        self.renderer.queue(points_text, points_text_rect, Renderer.LAYER_HUD)
+
+    def draw_debug(self) -> None:
+        """
+        Draw frame pacing information into the top left corner
+        """
+
+        pacer = self.pacer.get_debug_info()
+        if Settings.font_debug not in self.fonts:
+            self.fonts[Settings.font_debug] = pygame.font.SysFont(*Settings.font_debug)
+
+        # Changes every frame, so it is not worth caching
+        debug_text = self.surfaces.track(self.fonts[Settings.font_debug].render(
+            f"FPS: {self.clock.get_fps():.0f}  Frame: {pacer['frame_time']}/"
+            f"{pacer['budget']} ms  Level: {pacer['level']}", True, (255, 255, 0)),
+            'text')
+
+        self.renderer.queue(debug_text, (10, 10), Renderer.LAYER_HUD)
 
 
 if __name__ == '__main__':
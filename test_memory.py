@@ -0,0 +1,171 @@
+# pylint: disable=C0114
+# pylint: disable=C0116
+# pylint: disable=E1101
+# pylint: disable=C0115
+
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame # pylint: disable=C0413
+import game as game_module # pylint: disable=C0413
+from game import Game, SurfaceAccountant, SurfaceCache # pylint: disable=C0413
+
+SURFACE_SIZE = 10 * 10 * 4
+
+class FakeClock:
+    def __init__(self, frame_time) -> None:
+        self.frame_time = frame_time
+
+    def get_time(self) -> int:
+        """
+        Time of the last frame in ms
+        """
+
+        return self.frame_time
+
+    def get_fps(self) -> float:
+        """
+        Frames per second of the fake frame time
+        """
+
+        return 1000 / self.frame_time
+
+def create_surface() -> pygame.Surface:
+    return pygame.Surface((10, 10), pygame.SRCALPHA)
+
+def test_cache_evicts_to_budget():
+    accountant = SurfaceAccountant({'text': SURFACE_SIZE * 3})
+    cache = SurfaceCache(accountant, 'text')
+
+    for key in range(10):
+        cache.get(key, create_surface)
+
+    assert len(cache.surfaces) == 3
+    assert accountant.usage['text'] == SURFACE_SIZE * 3
+    assert accountant.peak['text'] == SURFACE_SIZE * 3
+    assert accountant.evictions == 7
+    assert accountant.overruns == 0
+    assert accountant.is_within_budget()
+
+def test_peak_includes_surfaces_evicted_right_away():
+    accountant = SurfaceAccountant({'text': SURFACE_SIZE * 3})
+    cache = SurfaceCache(accountant, 'text')
+
+    for key in range(3):
+        cache.get(key, create_surface)
+    # Twice as large as anything the cache kept room for
+    cache.get('large', lambda: pygame.Surface((10, 20), pygame.SRCALPHA))
+
+    assert accountant.usage['text'] <= SURFACE_SIZE * 3
+    assert accountant.peak['text'] == SURFACE_SIZE * 4
+    assert not accountant.is_within_budget()
+
+def test_eviction_keeps_lru_order():
+    accountant = SurfaceAccountant({'text': SURFACE_SIZE * 3})
+    cache = SurfaceCache(accountant, 'text')
+
+    in_use = cache.get('A', create_surface)
+    for key in 'BCD':
+        cache.get(key, create_surface)
+
+    assert list(cache.surfaces) == ['A', 'C', 'D']
+    assert in_use is cache.surfaces['A']
+
+def test_cache_keeps_referenced_surfaces():
+    accountant = SurfaceAccountant({'text': SURFACE_SIZE * 3})
+    cache = SurfaceCache(accountant, 'text')
+
+    in_use = [cache.get(key, create_surface) for key in range(5)]
+
+    assert len(cache.surfaces) == 5
+    assert accountant.usage['text'] == SURFACE_SIZE * 5
+    assert accountant.evictions == 0
+    assert accountant.overruns == 2
+    assert not accountant.is_within_budget()
+
+    in_use.clear()
+    cache.get(5, create_surface)
+
+    assert accountant.usage['text'] == SURFACE_SIZE * 3
+
+def test_usage_is_released_on_collection():
+    accountant = SurfaceAccountant({'bubbles': SURFACE_SIZE})
+
+    surface = accountant.track(create_surface(), 'bubbles')
+    assert accountant.usage['bubbles'] == SURFACE_SIZE
+
+    del surface
+    assert accountant.usage['bubbles'] == 0
+    assert accountant.peak['bubbles'] == SURFACE_SIZE
+
+def test_game_stays_within_budget(monkeypatch):
+    monkeypatch.setattr(pygame.mouse, 'set_cursor', lambda *args: None)
+    monkeypatch.setattr(Game, 'set_highscore', lambda highscore: None)
+
+    game = Game()
+    monkeypatch.setattr(game_module, 'game', game, raising=False)
+    game.clock = FakeClock(100)
+    game.bubble_size_timer.duration = 0 # grow every frame
+
+    for frame in range(500):
+        game.pause = frame % 50 == 0
+        game.debug = frame % 7 == 0
+        game.draw()
+        game.update()
+        game.points += 3
+
+        if game.game_over:
+            game.draw()
+            game.reset()
+
+    report = game.surfaces.get_report()
+    assert report['usage']['frames'] == report['peak']['frames']
+    assert report['overruns'] == 0
+    assert report['within_budget']
+
+def test_bubble_budget_evicts_unused_sizes(monkeypatch):
+    monkeypatch.setattr(pygame.mouse, 'set_cursor', lambda *args: None)
+    monkeypatch.setitem(game_module.Settings.memory_budgets, 'bubbles', 512 * 1024)
+
+    game = Game()
+    monkeypatch.setattr(game_module, 'game', game, raising=False)
+    bubble = game_module.Bubble((500, 250), 4)
+
+    for _ in range(40):
+        bubble.increase_size()
+
+    report = game.surfaces.get_report()
+    assert report['evictions'] > 0
+    assert report['usage']['bubbles'] <= report['budgets']['bubbles']
+    assert report['usage']['frames'] == report['peak']['frames']
+
+def test_bubbles_of_same_size_share_images(monkeypatch):
+    monkeypatch.setattr(pygame.mouse, 'set_cursor', lambda *args: None)
+
+    game = Game()
+    monkeypatch.setattr(game_module, 'game', game, raising=False)
+
+    first = game_module.Bubble((100, 100), 2)
+    second = game_module.Bubble((300, 300), 2)
+    assert first.image is second.image
+
+    first.increase_size()
+    assert first.image is not second.image
+    assert len(game.bubble_cache.surfaces) == 2
+
+def test_overlay_is_reused(monkeypatch):
+    monkeypatch.setattr(pygame.mouse, 'set_cursor', lambda *args: None)
+
+    game = Game()
+    monkeypatch.setattr(game_module, 'game', game, raising=False)
+    game.clock = FakeClock(100)
+    game.pause = True
+
+    for _ in range(3):
+        game.draw()
+
+    assert len(game.overlay_cache.surfaces) == 1
+    assert game.surfaces.evictions == 0
+    assert game.surfaces.get_report()['within_budget']
@@ -0,0 +1,87 @@
+# pylint: disable=C0114
+# pylint: disable=C0116
+
+from game import FramePacer, Settings
+
+FPS = 60
+SLOW = 1000 / FPS * 3
+FAST = 0.0
+
+def feed(pacer, frame_time, frames):
+    for _ in range(frames):
+        pacer.tick(frame_time)
+
+def test_starts_at_full_quality():
+    pacer = FramePacer(FPS)
+
+    assert pacer.level == FramePacer.LEVEL_FULL
+    assert pacer.should_update_hover()
+    assert pacer.should_check_collision()
+    assert pacer.get_animation_step() == 1
+
+def test_sustained_overrun_degrades_one_level():
+    pacer = FramePacer(FPS)
+    pacer.frame_time = SLOW # skip the ramp up of the moving average
+
+    feed(pacer, SLOW, Settings.pacer_frames_to_degrade - 1)
+    assert pacer.level == FramePacer.LEVEL_FULL
+
+    feed(pacer, SLOW, 1)
+    assert pacer.level == FramePacer.LEVEL_THROTTLE_HOVER
+
+def test_level_stops_at_throttle_collision():
+    pacer = FramePacer(FPS)
+    pacer.frame_time = SLOW
+
+    feed(pacer, SLOW, Settings.pacer_frames_to_degrade * 10)
+
+    assert pacer.level == FramePacer.LEVEL_THROTTLE_COLLISION
+    assert pacer.get_animation_step() == Settings.pacer_animation_step
+    checks = []
+    for _ in range(10):
+        pacer.tick(SLOW)
+        checks.append(pacer.should_check_collision())
+    assert True in checks and False in checks
+
+def test_headroom_restores_one_level():
+    pacer = FramePacer(FPS)
+    pacer.frame_time = SLOW
+    feed(pacer, SLOW, Settings.pacer_frames_to_degrade * 10)
+    pacer.frame_time = FAST
+
+    feed(pacer, FAST, Settings.pacer_frames_to_restore - 1)
+    assert pacer.level == FramePacer.LEVEL_THROTTLE_COLLISION
+
+    feed(pacer, FAST, 1)
+    assert pacer.level == FramePacer.LEVEL_SKIP_ANIMATION
+
+def test_level_stops_at_full():
+    pacer = FramePacer(FPS)
+    pacer.frame_time = SLOW
+    feed(pacer, SLOW, Settings.pacer_frames_to_degrade)
+    pacer.frame_time = FAST
+
+    feed(pacer, FAST, Settings.pacer_frames_to_restore * 10)
+
+    assert pacer.level == FramePacer.LEVEL_FULL
+    assert pacer.history[-1][1:3] == (FramePacer.LEVEL_THROTTLE_HOVER, FramePacer.LEVEL_FULL)
+
+def test_frames_within_budget_keep_level():
+    pacer = FramePacer(FPS)
+    pacer.frame_time = pacer.budget
+
+    feed(pacer, pacer.budget, Settings.pacer_frames_to_restore * 2)
+
+    assert pacer.level == FramePacer.LEVEL_FULL
+    assert not pacer.history
+
+def test_history_is_capped():
+    pacer = FramePacer(FPS)
+
+    for _ in range(Settings.pacer_history_length):
+        pacer.frame_time = SLOW
+        feed(pacer, SLOW, Settings.pacer_frames_to_degrade)
+        pacer.frame_time = FAST
+        feed(pacer, FAST, Settings.pacer_frames_to_restore)
+
+    assert len(pacer.history) == Settings.pacer_history_length
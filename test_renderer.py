@@ -0,0 +1,48 @@
+# pylint: disable=C0114
+# pylint: disable=C0116
+# pylint: disable=E1101
+
+import pygame
+from game import Renderer
+
+def create_surface(color) -> pygame.Surface:
+    surface = pygame.Surface((1, 1))
+    surface.fill(color)
+    return surface
+
+def draw(queued) -> tuple[int, int, int]:
+    """
+    Queue (color, layer) pairs in the given order, flush and return the resulting pixel
+    """
+
+    screen = pygame.Surface((1, 1))
+    renderer = Renderer(screen)
+
+    for color, layer in queued:
+        renderer.queue(create_surface(color), (0, 0), layer)
+    renderer.flush()
+
+    return tuple(screen.get_at((0, 0)))[:3]
+
+def test_cursor_is_drawn_after_overlay():
+    assert draw([((255, 0, 0), Renderer.LAYER_CURSOR),
+                 ((0, 0, 255), Renderer.LAYER_OVERLAY)]) == (255, 0, 0)
+
+def test_menu_text_is_drawn_after_restart_button():
+    assert draw([((0, 255, 0), Renderer.LAYER_MENU_TEXT),
+                 ((255, 255, 255), Renderer.LAYER_MENU)]) == (0, 255, 0)
+
+def test_queue_order_is_kept_within_a_layer():
+    assert draw([((255, 0, 0), Renderer.LAYER_BUBBLES),
+                 ((0, 0, 255), Renderer.LAYER_BUBBLES)]) == (0, 0, 255)
+
+def test_flush_empties_the_draw_list():
+    screen = pygame.Surface((1, 1))
+    renderer = Renderer(screen)
+
+    renderer.queue(create_surface((255, 0, 0)), (0, 0), Renderer.LAYER_HUD)
+    renderer.flush()
+    screen.fill((0, 0, 0))
+    renderer.flush()
+
+    assert tuple(screen.get_at((0, 0)))[:3] == (0, 0, 0)
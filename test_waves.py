@@ -0,0 +1,59 @@
+# pylint: disable=C0114
+# pylint: disable=C0116
+
+from game import Settings, WaveEngine
+
+def test_schedule_is_reproducible():
+    assert WaveEngine.build_schedule(42, 3) == WaveEngine.build_schedule(42, 3)
+    assert WaveEngine.build_schedule(42, 3) != WaveEngine.build_schedule(43, 3)
+
+def test_schedule_candidates():
+    for _, candidates, _ in WaveEngine.build_schedule(42, 0):
+        assert len(candidates) == Settings.wave_position_candidates
+        assert len(set(candidates)) == len(candidates)
+
+def test_difficulty_increases_per_level():
+    delays, limits = [], []
+    for level in range(30):
+        delay, limit, _ = WaveEngine.get_level_parameters(level)
+        delays.append(delay)
+        limits.append(limit)
+
+    assert delays == sorted(delays, reverse=True)
+    assert delays[-1] == Settings.wave_delay_min
+    assert limits == sorted(limits)
+
+def test_pop_due_spawns_after_delay():
+    waves = WaveEngine(seed=1)
+    delay = WaveEngine.get_level_parameters(0)[0]
+
+    assert waves.pop_due(delay - 1, 0) is None
+    assert waves.pop_due(1, 0) is not None
+    assert waves.pop_due(1, 1) is None
+
+def test_pop_due_spawns_one_per_call():
+    waves = WaveEngine(seed=1)
+    delay = WaveEngine.get_level_parameters(0)[0]
+
+    assert waves.pop_due(delay * 5, 0) is not None
+    assert waves.pop_due(0, 1) is None
+
+def test_pop_due_does_not_backlog_at_limit():
+    waves = WaveEngine(seed=1)
+    delay, limit, _ = WaveEngine.get_level_parameters(0)
+
+    assert waves.pop_due(delay * 20, limit + 1) is None
+    assert waves.pop_due(16, 2) is not None
+    assert waves.pop_due(16, 3) is None
+    assert waves.pop_due(delay - 16, 3) is not None
+
+def test_pop_due_advances_level_after_wave():
+    waves = WaveEngine(seed=1)
+    delay = WaveEngine.get_level_parameters(0)[0]
+
+    for _ in range(Settings.wave_length):
+        assert waves.pop_due(delay, 0) is not None
+    assert waves.level == 0
+
+    waves.pop_due(0, 0)
+    assert waves.level == 1